@@ -4,16 +4,35 @@ AI Daily Pulse - 数据抓取脚本
 面向后端开发者的 AI 提效信息中心，自动聚合 AI 快讯、GitHub Trending、HuggingFace 模型和 arXiv 论文
 """
 
+import html
+import io
 import json
 import os
+import re
 import time
 import logging
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
 import requests
 import feedparser
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时回退到标准库 json
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:  # 未安装 selectolax 时回退到 lxml + XPath
+    SelectolaxParser = None
 
 # 配置日志
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
@@ -29,31 +48,71 @@ REQUEST_TIMEOUT = 30
 # 重试次数
 MAX_RETRIES = 3
 
+# 服务端 Retry-After 的最长等待时间（秒），避免单个源拖住整个任务
+RETRY_AFTER_MAX = 30
+
+# 本地缓存有效期（小时）：arXiv 每天只发布一次新列表；
+# 定时任务每 12 小时一次且启动时间会漂移，取明显小于 24 的值，避免隔天的运行被误判为新鲜而跳过
+ARXIV_CACHE_HOURS = 20
+HUGGINGFACE_CACHE_HOURS = 6
+
+
+class _CappedRetry(Retry):
+    """遵循 Retry-After，但最长只等待 RETRY_AFTER_MAX 秒"""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+# 全局共享的 HTTP 会话：复用 keep-alive 连接池，重试与退避交给 urllib3 处理
+# Accept-Encoding 使用 urllib3 实际可解码的编码（安装 brotli 后包含 br）
+# 未改用 httpx 的 HTTP/2：每个域名每次运行只有 1~2 个请求，keep-alive 已省去重复握手，
+# 而切换客户端会失去 urllib3 的 Retry 策略（按状态码重试、Retry-After 上限）
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "AI-Daily-Pulse/1.0",
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+_retry = _CappedRetry(
+    total=MAX_RETRIES,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=_retry)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 
 def safe_request(url: str, params: dict = None, headers: dict = None) -> Optional[requests.Response]:
-    """带重试逻辑的 HTTP GET 请求"""
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = requests.get(
-                url,
-                params=params,
-                headers=headers or {"User-Agent": "AI-Daily-Pulse/1.0"},
-                timeout=REQUEST_TIMEOUT,
-            )
-            resp.raise_for_status()
-            return resp
-        except Exception as e:
-            logger.warning(f"请求失败 (尝试 {attempt + 1}/{MAX_RETRIES}): {url} — {e}")
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(2 ** attempt)
-    return None
+    """基于共享会话的 HTTP GET 请求（失败时返回 None）"""
+    try:
+        resp = SESSION.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT)
+        resp.raise_for_status()
+        logger.debug(
+            f"{url}: {len(resp.content)} 字节 (Content-Encoding: {resp.headers.get('Content-Encoding', 'identity')})"
+        )
+        return resp
+    except Exception as e:
+        logger.warning(f"请求失败: {url} — {e}")
+        return None
 
 
 def save_json(filename: str, data: dict) -> None:
-    """将数据保存为 JSON 文件"""
+    """将数据保存为 JSON 文件（先写临时文件再 os.replace，避免中途退出留下半个文件）"""
     path = os.path.join(DATA_DIR, filename)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp_path = path + ".tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
     logger.info(f"已保存: {path}")
 
 
@@ -61,17 +120,89 @@ def load_json(filename: str) -> Optional[dict]:
     """加载已有的 JSON 文件"""
     path = os.path.join(DATA_DIR, filename)
     if os.path.exists(path):
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     return None
 
 
+def is_fresh(filename: str, hours: int = 24, key: str = "") -> Optional[dict]:
+    """若已有 JSON 文件在有效期内（且 key 对应列表非空）则返回其内容，否则返回 None"""
+    data = load_json(filename)
+    if not data or (key and not data.get(key)):
+        return None
+    try:
+        updated = datetime.fromisoformat(data.get("updated", ""))
+    except (TypeError, ValueError):
+        return None
+    if updated.tzinfo is None:
+        # 不带时区的时间戳按 UTC 处理
+        updated = updated.replace(tzinfo=timezone.utc)
+    if datetime.now(timezone.utc) - updated < timedelta(hours=hours):
+        return data
+    return None
+
+
 # ---------------------------------------------------------------------------
 # 1. arXiv 论文
 # ---------------------------------------------------------------------------
 
+# arXiv API 返回的 Atom 命名空间
+ATOM_NS = "http://www.w3.org/2005/Atom"
+_ATOM = {"a": ATOM_NS}
+
+
+def _parse_arxiv_atom(content: bytes) -> list[dict]:
+    """流式解析 arXiv Atom 响应（格式固定，无需 feedparser 的通用方言处理）
+
+    响应经明文 HTTP 传输，结果会被提交到仓库：禁止解析外部实体、加载 DTD 和访问网络
+    （lxml 5.0 之前默认会展开外部实体），防止读取本地文件。
+
+    >>> xml = (b'<?xml version="1.0"?><!DOCTYPE feed [<!ENTITY x SYSTEM "file:///etc/passwd">]>'
+    ...        b'<feed xmlns="http://www.w3.org/2005/Atom"><entry><title>A&x;</title></entry></feed>')
+    >>> _parse_arxiv_atom(xml)[0]["title"]
+    'A'
+    """
+    papers = []
+    entries = etree.iterparse(
+        io.BytesIO(content),
+        tag=f"{{{ATOM_NS}}}entry",
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+    )
+    for _, entry in entries:
+        try:
+            entry_id = entry.findtext("a:id", "", namespaces=_ATOM)
+            links = entry.xpath("a:link[@rel='alternate']/@href", namespaces=_ATOM)
+            papers.append({
+                "id": entry_id.split("/abs/")[-1],
+                "title": entry.findtext("a:title", "", namespaces=_ATOM).replace("\n", " ").strip(),
+                "authors": [
+                    a.findtext("a:name", "", namespaces=_ATOM)
+                    for a in entry.findall("a:author", namespaces=_ATOM)[:5]
+                ],
+                "summary": entry.findtext("a:summary", "", namespaces=_ATOM).replace("\n", " ").strip()[:300],
+                "published": entry.findtext("a:published", "", namespaces=_ATOM)[:10],
+                "link": links[0] if links else entry_id,
+                "categories": [c.get("term", "") for c in entry.findall("a:category", namespaces=_ATOM)],
+            })
+        except Exception as e:
+            logger.warning(f"解析 arXiv 条目失败: {e}")
+        finally:
+            entry.clear()
+    return papers
+
+
 def fetch_arxiv(max_results: int = 15) -> dict:
     """从 arXiv API 获取最新 AI/LLM 相关论文"""
+    cached = is_fresh("arxiv.json", ARXIV_CACHE_HOURS, key="papers")
+    if cached:
+        logger.info("arXiv: 缓存仍在有效期内，跳过抓取")
+        return cached
+
     logger.info("正在抓取 arXiv 论文...")
     categories = "cat:cs.AI+OR+cat:cs.CL+OR+cat:cs.LG"
     url = "http://export.arxiv.org/api/query"
@@ -87,21 +218,11 @@ def fetch_arxiv(max_results: int = 15) -> dict:
         logger.error("arXiv 数据抓取失败，使用现有数据")
         return load_json("arxiv.json") or {"updated": datetime.now(timezone.utc).isoformat(), "papers": []}
 
-    feed = feedparser.parse(resp.text)
-    papers = []
-    for entry in feed.entries:
-        try:
-            papers.append({
-                "id": entry.get("id", "").split("/abs/")[-1],
-                "title": entry.get("title", "").replace("\n", " ").strip(),
-                "authors": [a.get("name", "") for a in entry.get("authors", [])[:5]],
-                "summary": entry.get("summary", "").replace("\n", " ").strip()[:300],
-                "published": entry.get("published", "")[:10],
-                "link": entry.get("link", ""),
-                "categories": [t.get("term", "") for t in entry.get("tags", [])],
-            })
-        except Exception as e:
-            logger.warning(f"解析 arXiv 条目失败: {e}")
+    try:
+        papers = _parse_arxiv_atom(resp.content)
+    except etree.XMLSyntaxError as e:
+        logger.error(f"arXiv 响应解析失败，使用现有数据: {e}")
+        return load_json("arxiv.json") or {"updated": datetime.now(timezone.utc).isoformat(), "papers": []}
 
     result = {"updated": datetime.now(timezone.utc).isoformat(), "papers": papers}
     logger.info(f"arXiv: 获取到 {len(papers)} 篇论文")
@@ -114,6 +235,11 @@ def fetch_arxiv(max_results: int = 15) -> dict:
 
 def fetch_huggingface(limit: int = 15) -> dict:
     """从 HuggingFace API 获取最近更新的热门模型"""
+    cached = is_fresh("huggingface.json", HUGGINGFACE_CACHE_HOURS, key="models")
+    if cached:
+        logger.info("HuggingFace: 缓存仍在有效期内，跳过抓取")
+        return cached
+
     logger.info("正在抓取 HuggingFace 模型...")
     url = "https://huggingface.co/api/models"
     params = {
@@ -157,6 +283,61 @@ def fetch_huggingface(limit: int = 15) -> dict:
 # 3. GitHub Trending
 # ---------------------------------------------------------------------------
 
+def _xp_class(name: str) -> str:
+    """生成匹配 class 属性中某个类名的 XPath 谓词"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# lxml 回退路径使用的预编译 XPath（与 selectolax 的 CSS 选择器一一对应）
+_XP_ARTICLES = etree.XPath(f"//article[{_xp_class('Box-row')}]")
+_XP_REPO_LINK = etree.XPath(f".//h2[{_xp_class('h3')}]//a")
+_XP_DESC = etree.XPath(f".//p[{_xp_class('col-9')}]")
+_XP_LANG = etree.XPath(".//*[@itemprop='programmingLanguage']")
+_XP_STARS = etree.XPath(f".//a[{_xp_class('Link--muted')}]")
+_XP_STARS_TODAY = etree.XPath(f".//span[{_xp_class('d-inline-block')} and {_xp_class('float-sm-right')}]")
+
+
+def _lxml_text(elements: list) -> str:
+    """取首个元素的文本（等价于 get_text(strip=True)）"""
+    if not elements:
+        return ""
+    return "".join(t.strip() for t in elements[0].itertext())
+
+
+def _extract_trending_selectolax(article) -> Optional[tuple[str, str, str, str, str]]:
+    """用 selectolax 提取单个 Trending 条目的原始字段"""
+    link = article.css_first("h2.h3 a")
+    if link is None:
+        return None
+    desc_el = article.css_first("p.col-9")
+    lang_el = article.css_first("[itemprop='programmingLanguage']")
+    stars_el = article.css_first("a.Link--muted")
+    today_el = article.css_first("span.d-inline-block.float-sm-right")
+    return (
+        (link.attributes.get("href") or "").strip("/"),
+        desc_el.text(strip=True) if desc_el else "",
+        lang_el.text(strip=True) if lang_el else "",
+        stars_el.text(strip=True) if stars_el else "0",
+        today_el.text(strip=True) if today_el else "0 stars today",
+    )
+
+
+def _extract_trending_lxml(article) -> Optional[tuple[str, str, str, str, str]]:
+    """用 lxml 预编译 XPath 提取单个 Trending 条目的原始字段"""
+    link = _XP_REPO_LINK(article)
+    if not link:
+        return None
+    stars_el = _XP_STARS(article)
+    today_el = _XP_STARS_TODAY(article)
+    return (
+        link[0].get("href", "").strip("/"),
+        _lxml_text(_XP_DESC(article)),
+        _lxml_text(_XP_LANG(article)),
+        _lxml_text(stars_el) if stars_el else "0",
+        _lxml_text(today_el) if today_el else "0 stars today",
+    )
+
+
 def fetch_github_trending(language: str = "") -> dict:
     """爬取 GitHub Trending 中的热门 AI/ML 仓库（不限语言）"""
     logger.info("正在抓取 GitHub Trending...")
@@ -191,23 +372,21 @@ def fetch_github_trending(language: str = "") -> dict:
         logger.error("GitHub Trending 数据抓取失败，使用现有数据")
         return load_json("github_trending.json") or {"updated": datetime.now(timezone.utc).isoformat(), "repositories": []}
 
-    soup = BeautifulSoup(resp.text, "lxml")
+    if SelectolaxParser is not None:
+        articles = SelectolaxParser(resp.text).css("article.Box-row")[:15]
+        extract = _extract_trending_selectolax
+    else:
+        articles = _XP_ARTICLES(lxml.html.fromstring(resp.content))[:15]
+        extract = _extract_trending_lxml
+
     repos = []
-    articles = soup.select("article.Box-row")[:15]
     for article in articles:
         try:
-            h2 = article.select_one("h2.h3 a")
-            if not h2:
+            fields = extract(article)
+            if fields is None:
                 continue
-            full_name = h2.get("href", "").strip("/")
-            desc_el = article.select_one("p.col-9")
-            desc = desc_el.get_text(strip=True) if desc_el else ""
-            lang_el = article.select_one("[itemprop='programmingLanguage']")
-            lang = lang_el.get_text(strip=True) if lang_el else ""
-            stars_el = article.select("a.Link--muted")
-            stars_text = stars_el[0].get_text(strip=True).replace(",", "") if stars_el else "0"
-            today_el = article.select_one("span.d-inline-block.float-sm-right")
-            today_text = today_el.get_text(strip=True) if today_el else "0 stars today"
+            full_name, desc, lang, stars_text, today_text = fields
+            stars_text = stars_text.replace(",", "")
             stars_today_text = today_text.split()[0].replace(",", "") if today_text else "0"
 
             try:
@@ -252,12 +431,39 @@ RSS_FEEDS = [
 ]
 
 
+# 用于去除摘要中的 HTML 标签：只匹配真正的标签/注释/声明，"x < y" 这类纯文本比较符号保持不变
+_TAG_RE = re.compile(r"<!--.*?-->|</?[A-Za-z][^>]*>|<[!?][^>]*>", re.DOTALL)
+
+
+def strip_html(text: str) -> str:
+    """在原始标记上去除 HTML 标签，最后只反转义一次实体（转义过的 <...> 属于正文，需要保留）
+
+    标签替换为空格以免相邻段落粘连，再把连续空白（缩进、换行）合并为一个空格。
+
+    >>> strip_html("<p>use List&lt;String&gt; in Java</p>")
+    'use List<String> in Java'
+    >>> strip_html("<p>Vec&lt;T&gt; is fast</p>")
+    'Vec<T> is fast'
+    >>> strip_html("x < y and y > z")
+    'x < y and y > z'
+    >>> strip_html("latency &lt; 10ms and throughput &gt; 1k")
+    'latency < 10ms and throughput > 1k'
+    >>> strip_html("<p>Hello &amp; <a href='x'>world</a></p><!-- ad -->")
+    'Hello & world'
+    >>> strip_html("<div>\\n    <p>\\n      大模型推理优化\\n    </p>\\n    <p>\\n      第二段\\n    </p>\\n</div>")
+    '大模型推理优化 第二段'
+    >>> strip_html("<p>first</p><p>second</p>")
+    'first second'
+    """
+    return " ".join(html.unescape(_TAG_RE.sub(" ", text)).split())
+
+
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+
 def is_chinese(text: str) -> bool:
     """检测文本是否包含中文字符"""
-    for char in text:
-        if '\u4e00' <= char <= '\u9fff':
-            return True
-    return False
+    return _CJK_RE.search(text) is not None
 
 
 def mark_english_title(title: str) -> str:
@@ -267,60 +473,125 @@ def mark_english_title(title: str) -> str:
     return f"[EN] {title}"
 
 
-def fetch_rss_news(max_per_feed: int = 5) -> dict:
-    """从多个 RSS 源获取 AI 相关文章"""
-    logger.info("正在抓取 RSS 新闻...")
-    articles = []
+def _parse_feed_bytes(source_name: str, content: bytes, max_per_feed: int, known: dict = None) -> list[dict]:
+    """解析 RSS/Atom 原始字节，返回整理好的文章列表（纯 CPU 计算，不做网络请求）
 
-    for source_name, feed_url in RSS_FEEDS:
+    known 为上次运行已整理好的 {link: article}，命中的条目直接复用，跳过日期解析与 HTML 清洗。
+    """
+    known = known or {}
+    articles = []
+    feed = feedparser.parse(content)
+    # 缺少发布日期的条目统一使用当前时间，只在循环外取一次
+    now_utc = datetime.now(timezone.utc)
+    now_struct = now_utc.timetuple()
+    today_str = now_utc.strftime("%Y-%m-%d")
+    for entry in feed.entries[:max_per_feed]:
+        link = entry.get("link", "")
+        cached = known.get(link) if link else None
+        if cached is not None and cached.get("source") == source_name:
+            articles.append(cached)
+            continue
         try:
-            resp = safe_request(feed_url)
-            if resp is None:
-                logger.warning(f"RSS 源不可用: {source_name}")
-                continue
-
-            feed = feedparser.parse(resp.text)
-            count = 0
-            for entry in feed.entries[:max_per_feed]:
+            published = entry.get("published", entry.get("updated", ""))
+            if published:
+                # 尝试解析日期
                 try:
-                    published = entry.get("published", entry.get("updated", ""))
-                    if published:
-                        # 尝试解析日期
-                        try:
-                            dt = datetime(*entry.get("published_parsed", time.gmtime())[:6], tzinfo=timezone.utc)
-                            published_date = dt.strftime("%Y-%m-%d")
-                        except Exception:
-                            published_date = published[:10]
-                    else:
-                        published_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-                    summary = entry.get("summary", "")
-                    # 去除 HTML 标签
-                    soup = BeautifulSoup(summary, "lxml")
-                    clean_summary = soup.get_text(strip=True)[:300]
-
-                    articles.append({
-                        "title": mark_english_title(entry.get("title", "").strip()),
-                        "source": source_name,
-                        "published": published_date,
-                        "summary": clean_summary,
-                        "link": entry.get("link", ""),
-                        "category": "AI News",
-                    })
-                    count += 1
-                except Exception as e:
-                    logger.warning(f"解析 RSS 条目失败 ({source_name}): {e}")
-
-            logger.info(f"  {source_name}: {count} 篇文章")
+                    dt = datetime(*entry.get("published_parsed", now_struct)[:6], tzinfo=timezone.utc)
+                    published_date = dt.strftime("%Y-%m-%d")
+                except Exception:
+                    published_date = published[:10]
+            else:
+                published_date = today_str
+
+            summary = entry.get("summary", "")
+            # 去除 HTML 标签
+            clean_summary = strip_html(summary)[:300]
+
+            articles.append({
+                "title": mark_english_title(entry.get("title", "").strip()),
+                "source": source_name,
+                "published": published_date,
+                "summary": clean_summary,
+                "link": link,
+                "category": "AI News",
+            })
         except Exception as e:
-            logger.warning(f"RSS 源抓取失败 ({source_name}): {e}")
+            logger.warning(f"解析 RSS 条目失败 ({source_name}): {e}")
+    return articles
+
+
+def _fetch_feed(
+    source_name: str, feed_url: str, max_per_feed: int, cached: dict, known: dict
+) -> tuple[list[dict], dict]:
+    """抓取并解析单个 RSS 源，返回 (文章列表, 新的缓存条目)
+
+    cached 为上次抓取记录的 {"etag", "last_modified", "articles"}，用于条件请求；
+    服务端返回 304 时直接复用缓存的文章；known 透传给 _parse_feed_bytes。
+    """
+    headers = {}
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        resp = safe_request(feed_url, headers=headers)
+        if resp is None:
+            logger.warning(f"RSS 源不可用: {source_name}")
+            return [], cached
+
+        if resp.status_code == 304:
+            articles = cached.get("articles", [])
+            logger.info(f"  {source_name}: 未更新 (304)，复用 {len(articles)} 篇缓存文章")
+            return articles, cached
+
+        # 在抓取线程内解析，与其他源的网络等待相互重叠
+        articles = _parse_feed_bytes(source_name, resp.content, max_per_feed, known)
+        logger.info(f"  {source_name}: {len(articles)} 篇文章")
+    except Exception as e:
+        logger.warning(f"RSS 源抓取失败 ({source_name}): {e}")
+        return [], cached
+
+    cache_entry = {"articles": articles}
+    if resp.headers.get("ETag"):
+        cache_entry["etag"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        cache_entry["last_modified"] = resp.headers["Last-Modified"]
+    return articles, cache_entry
+
+
+def fetch_rss_news(max_per_feed: int = 5) -> tuple[dict, dict]:
+    """从多个 RSS 源并发获取 AI 相关文章，返回 (文章数据, rss_cache.json 的新内容)"""
+    logger.info("正在抓取 RSS 新闻...")
+    articles = []
+
+    # 各源的 ETag / Last-Modified 及上次解析结果，用于条件请求
+    cache = (load_json("rss_cache.json") or {}).get("feeds", {})
+    new_cache = {}
+
+    # 上次运行已整理好的文章（按链接索引），未变化的条目无需重新解析
+    known = {a["link"]: a for a in (load_json("rss_news.json") or {}).get("articles", []) if a.get("link")}
+    for feed_cache in cache.values():
+        known.update((a["link"], a) for a in feed_cache.get("articles", []) if a.get("link"))
+
+    # 各源并发抓取，结果按 RSS_FEEDS 顺序合并
+    with ThreadPoolExecutor(max_workers=len(RSS_FEEDS)) as pool:
+        results = pool.map(
+            lambda feed: _fetch_feed(*feed, max_per_feed, cache.get(feed[1], {}), known),
+            RSS_FEEDS,
+        )
+        for (_, feed_url), (feed_articles, cache_entry) in zip(RSS_FEEDS, results):
+            articles.extend(feed_articles)
+            if cache_entry:
+                new_cache[feed_url] = cache_entry
 
     # 按发布日期排序（最新优先）
     articles.sort(key=lambda x: x.get("published", ""), reverse=True)
 
-    result = {"updated": datetime.now(timezone.utc).isoformat(), "articles": articles[:20]}
+    now = datetime.now(timezone.utc).isoformat()
+    result = {"updated": now, "articles": articles[:20]}
     logger.info(f"RSS: 共获取 {len(articles)} 篇文章")
-    return result
+    return result, {"updated": now, "feeds": new_cache}
 
 
 # ---------------------------------------------------------------------------
@@ -330,24 +601,20 @@ def fetch_rss_news(max_per_feed: int = 5) -> dict:
 def update_stats(arxiv_data: dict, hf_data: dict, github_data: dict, rss_data: dict) -> dict:
     """生成统计数据"""
     # 收集标签
-    tag_counts: dict[str, int] = {}
+    tag_counts = Counter()
     for paper in arxiv_data.get("papers", []):
-        for cat in paper.get("categories", []):
-            tag_counts[cat] = tag_counts.get(cat, 0) + 1
+        tag_counts.update(paper.get("categories", ()))
     for model in hf_data.get("models", []):
-        for tag in model.get("tags", []):
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        tag_counts.update(model.get("tags", ()))
 
-    top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    top_tags = tag_counts.most_common(10)
 
     # 编程语言统计
-    lang_counts: dict[str, int] = {}
-    for repo in github_data.get("repositories", []):
-        lang = repo.get("language", "")
-        if lang:
-            lang_counts[lang] = lang_counts.get(lang, 0) + 1
+    lang_counts = Counter(
+        lang for repo in github_data.get("repositories", []) if (lang := repo.get("language"))
+    )
 
-    top_languages = sorted(lang_counts.items(), key=lambda x: x[1], reverse=True)[:5]
+    top_languages = lang_counts.most_common(5)
 
     # 加载静态数据文件的条目数
     tools_data = load_json("ai_tools.json") or {}
@@ -368,57 +635,37 @@ def update_stats(arxiv_data: dict, hf_data: dict, github_data: dict, rss_data: d
     }
 
 
+# 历史趋势保留天数与记录的字段
+HISTORY_DAYS = 7
+HISTORY_FIELDS = ("arxiv", "huggingface", "github_trending", "rss_news", "ai_tools", "dev_tips")
+
+
 def update_history(stats_data: dict) -> dict:
     """更新 7 天历史趋势数据"""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    history = load_json("history.json") or {
-        "updated": datetime.now(timezone.utc).isoformat(),
-        "dates": [],
-        "arxiv": [],
-        "huggingface": [],
-        "github_trending": [],
-        "rss_news": [],
-        "ai_tools": [],
-        "dev_tips": [],
-    }
+    now = datetime.now(timezone.utc)
+    today = now.strftime("%Y-%m-%d")
+    history = load_json("history.json") or {}
 
-    # 确保新字段存在（向后兼容）
-    for field in ("ai_tools", "dev_tips"):
-        if field not in history:
-            history[field] = [0] * len(history.get("dates", []))
+    # 使用定长 deque 作为滚动窗口，追加时自动淘汰最早的一天
+    dates = history.get("dates", [])
+    window = {"dates": deque(dates, maxlen=HISTORY_DAYS)}
+    for field in HISTORY_FIELDS:
+        # 缺失字段按 0 补齐（向后兼容）
+        window[field] = deque(history.get(field, [0] * len(dates)), maxlen=HISTORY_DAYS)
 
     counts = stats_data.get("counts", {})
 
     # 如果今天的数据已存在，则更新；否则追加
-    if today in history.get("dates", []):
-        idx = history["dates"].index(today)
-        history["arxiv"][idx] = counts.get("arxiv", 0)
-        history["huggingface"][idx] = counts.get("huggingface", 0)
-        history["github_trending"][idx] = counts.get("github_trending", 0)
-        history["rss_news"][idx] = counts.get("rss_news", 0)
-        history["ai_tools"][idx] = counts.get("ai_tools", 0)
-        history["dev_tips"][idx] = counts.get("dev_tips", 0)
+    if today in window["dates"]:
+        idx = window["dates"].index(today)
+        for field in HISTORY_FIELDS:
+            window[field][idx] = counts.get(field, 0)
     else:
-        history["dates"].append(today)
-        history["arxiv"].append(counts.get("arxiv", 0))
-        history["huggingface"].append(counts.get("huggingface", 0))
-        history["github_trending"].append(counts.get("github_trending", 0))
-        history["rss_news"].append(counts.get("rss_news", 0))
-        history["ai_tools"].append(counts.get("ai_tools", 0))
-        history["dev_tips"].append(counts.get("dev_tips", 0))
-
-    # 只保留最近 7 天
-    if len(history["dates"]) > 7:
-        history["dates"] = history["dates"][-7:]
-        history["arxiv"] = history["arxiv"][-7:]
-        history["huggingface"] = history["huggingface"][-7:]
-        history["github_trending"] = history["github_trending"][-7:]
-        history["rss_news"] = history["rss_news"][-7:]
-        history["ai_tools"] = history["ai_tools"][-7:]
-        history["dev_tips"] = history["dev_tips"][-7:]
-
-    history["updated"] = datetime.now(timezone.utc).isoformat()
-    return history
+        window["dates"].append(today)
+        for field in HISTORY_FIELDS:
+            window[field].append(counts.get(field, 0))
+
+    return {"updated": now.isoformat(), **{k: list(v) for k, v in window.items()}}
 
 
 # ---------------------------------------------------------------------------
@@ -429,33 +676,43 @@ def main():
     logger.info("=== AI Daily Pulse 数据抓取开始 ===")
     start_time = time.time()
 
-    # 各数据源独立抓取，互不影响
+    # 各数据源并发抓取，互不影响
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        arxiv_future = pool.submit(fetch_arxiv)
+        hf_future = pool.submit(fetch_huggingface)
+        github_future = pool.submit(fetch_github_trending)
+        rss_future = pool.submit(fetch_rss_news)
+
+    # 待写入的输出文件，统一在最后并发写入
+    outputs = []
+
     try:
-        arxiv_data = fetch_arxiv()
-        save_json("arxiv.json", arxiv_data)
+        arxiv_data = arxiv_future.result()
+        outputs.append(("arxiv.json", arxiv_data))
     except Exception as e:
         logger.error(f"arXiv 抓取异常: {e}")
         arxiv_data = load_json("arxiv.json") or {"papers": []}
 
     try:
-        hf_data = fetch_huggingface()
-        save_json("huggingface.json", hf_data)
+        hf_data = hf_future.result()
+        outputs.append(("huggingface.json", hf_data))
     except Exception as e:
         logger.error(f"HuggingFace 抓取异常: {e}")
         hf_data = load_json("huggingface.json") or {"models": []}
 
     try:
-        github_data = fetch_github_trending()
-        save_json("github_trending.json", github_data)
+        github_data = github_future.result()
+        outputs.append(("github_trending.json", github_data))
     except Exception as e:
         logger.error(f"GitHub Trending 抓取异常: {e}")
         github_data = load_json("github_trending.json") or {"repositories": []}
 
     try:
-        rss_data = fetch_rss_news()
+        rss_data, rss_cache = rss_future.result()
         # Save as both rss_news.json (backward compat) and ai_news.json (new frontend)
-        save_json("rss_news.json", rss_data)
-        save_json("ai_news.json", rss_data)
+        outputs.append(("rss_news.json", rss_data))
+        outputs.append(("ai_news.json", rss_data))
+        outputs.append(("rss_cache.json", rss_cache))
     except Exception as e:
         logger.error(f"RSS 抓取异常: {e}")
         rss_data = load_json("rss_news.json") or {"articles": []}
@@ -463,13 +720,22 @@ def main():
     # 更新统计和历史数据
     try:
         stats_data = update_stats(arxiv_data, hf_data, github_data, rss_data)
-        save_json("stats.json", stats_data)
+        outputs.append(("stats.json", stats_data))
 
         history_data = update_history(stats_data)
-        save_json("history.json", history_data)
+        outputs.append(("history.json", history_data))
     except Exception as e:
         logger.error(f"统计数据更新异常: {e}")
 
+    # 各文件互不依赖，并发写入
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        save_futures = [(filename, pool.submit(save_json, filename, data)) for filename, data in outputs]
+    for filename, future in save_futures:
+        try:
+            future.result()
+        except Exception as e:
+            logger.error(f"保存 {filename} 失败: {e}")
+
     elapsed = time.time() - start_time
     logger.info(f"=== 数据抓取完成，耗时 {elapsed:.1f} 秒 ===")
 